@@ -9,13 +9,6 @@ import re
 import typer
 from pathlib import Path
 from typing import Optional
-from enum import Enum
-
-from ..config.loader import ConfigLoader
-from ..databases.factory import DatabaseFactory
-from ..core.backup import perform_backup
-from ..core.restore import perform_restore
-from ..logging.logger import setup_logger
 
 
 # Create Typer app
@@ -26,12 +19,26 @@ app = typer.Typer(
 )
 
 
-class DatabaseType(str, Enum):
-    """Supported database types"""
-    postgres = "postgres"
-    mysql = "mysql"
-    sqlite = "sqlite"
-    mongodb = "mongodb"
+# Supported database types; must match the keys of DatabaseFactory._handlers
+# (kept separate so --help and validation don't import the factory)
+SUPPORTED_DATABASES = ('postgres', 'mysql', 'sqlite', 'mongodb')
+
+
+def _validate_db_type(value: str) -> str:
+    """Reject --db values that have no handler"""
+    if value not in SUPPORTED_DATABASES:
+        raise typer.BadParameter(
+            f"'{value}' is not one of {', '.join(SUPPORTED_DATABASES)}"
+        )
+    return value
+
+
+# Pattern: <type>_<db_name>_<suffix>_<date>_<time>[.sql][.tar[.gz]]
+# Supports: postgres, mysql, sqlite, mongo
+_BACKUP_FILENAME_RE = re.compile(
+    r'^(?:postgres|mysql|sqlite|mongo)_(.+?)_(?:full|archive)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}(?:-\d{2})?'
+    r'(?:\.sql)?(?:\.tar(?:\.gz)?)?$'
+)
 
 
 def extract_db_name_from_filename(filename: str) -> Optional[str]:
@@ -52,13 +59,8 @@ def extract_db_name_from_filename(filename: str) -> Optional[str]:
         >>> extract_db_name_from_filename("postgres_my_production_db_full_2026-01-07_23-45-12.sql.tar")
         'my_production_db'
     """
-    # Remove common extensions
-    name = filename.replace('.tar.gz', '').replace('.tar', '').replace('.sql', '')
-    
-    # Pattern: <type>_<db_name>_<type>_<date>_<time>
-    # Supports: postgres, mysql, sqlite, mongo
-    pattern = r'^(?:postgres|mysql|sqlite|mongo)_(.+?)_(?:full|archive)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}(?:-\d{2})?$'
-    match = re.match(pattern, name)
+    # Extensions are matched by the pattern itself
+    match = _BACKUP_FILENAME_RE.match(filename)
     
     if match:
         return match.group(1)
@@ -163,10 +165,11 @@ POSTGRES_PASSWORD={password}
 
 @app.command()
 def backup(
-    db: DatabaseType = typer.Option(
+    db: str = typer.Option(
         ...,
         "--db",
-        help="Database type (postgres, mysql, sqlite, mongodb)"
+        help="Database type (postgres, mysql, sqlite, mongodb)",
+        callback=_validate_db_type
     ),
     db_name: str = typer.Option(
         ...,
@@ -178,6 +181,11 @@ def backup(
         "--compress",
         help="Compress the backup file using tar.gz"
     ),
+    check_conn: bool = typer.Option(
+        False,
+        "--check-conn",
+        help="Test the database connection before starting the backup"
+    ),
     config_file: Optional[str] = typer.Option(
         None,
         "--config",
@@ -190,39 +198,43 @@ def backup(
     Example:
         clidup backup --db postgres --db-name myapp_db --compress
     """
+    # Deferred so --help/--version don't pay for config, handlers and logging
+    from ..config.loader import ConfigLoader
+    from ..databases.factory import DatabaseFactory
+    from ..core.backup import perform_backup
+    from ..logging.logger import setup_logger
+    
     try:
         # Load configuration
         config = ConfigLoader(config_file)
         
-        # Setup logger
-        log_file = config.get_backup_directory() / "clidup.log"
-        logger = setup_logger(log_file=log_file)
-        
         # Get database configuration
-        if db == DatabaseType.postgres:
+        if db == "postgres":
             db_config = config.get_postgres_config()
-        elif db == DatabaseType.mysql:
+        elif db == "mysql":
             db_config = config.get_mysql_config()
-        elif db == DatabaseType.sqlite:
+        elif db == "sqlite":
             db_config = config.get_sqlite_config()
-        elif db == DatabaseType.mongodb:
+        else:  # mongodb; --db is already checked by _validate_db_type
             db_config = config.get_mongodb_config()
-        else:
-            typer.echo(f"Error: Unsupported database type: {db}", err=True)
-            raise typer.Exit(code=1)
             
-        db_handler = DatabaseFactory.get_handler(db.value, db_config)
+        db_handler = DatabaseFactory.get_handler(db, db_config)
         
         # Get backup directory
         backup_dir = config.get_backup_directory()
         
+        # Setup logger once the command is known to be runnable
+        log_file = backup_dir / "clidup.log"
+        logger = setup_logger(log_file=log_file)
+        
         # Perform backup
         backup_file = perform_backup(
             db_handler=db_handler,
-            db_type=db.value,
+            db_type=db,
             db_name=db_name,
             backup_dir=backup_dir,
-            compress=compress
+            compress=compress,
+            check_connection=check_conn
         )
         
         typer.echo(f"\nBackup completed successfully!")
@@ -245,10 +257,11 @@ def backup(
 
 @app.command()
 def restore(
-    db: DatabaseType = typer.Option(
+    db: str = typer.Option(
         ...,
         "--db",
-        help="Database type (postgres, mysql, sqlite, mongodb)"
+        help="Database type (postgres, mysql, sqlite, mongodb)",
+        callback=_validate_db_type
     ),
     file: str = typer.Option(
         ...,
@@ -270,6 +283,11 @@ def restore(
         "--yes",
         "-y",
         help="Skip confirmation prompt (use with caution)"
+    ),
+    check_conn: bool = typer.Option(
+        False,
+        "--check-conn",
+        help="Test the database connection before starting the restore"
     )
 ):
     """
@@ -278,32 +296,31 @@ def restore(
     Example:
         clidup restore --db postgres --file backups/postgres_myapp_db_full_2026-01-07_22-30.sql
     """
+    # Deferred so --help/--version don't pay for config, handlers and logging
+    from ..config.loader import ConfigLoader
+    from ..databases.factory import DatabaseFactory
+    from ..core.restore import perform_restore
+    from ..logging.logger import setup_logger
+    
     try:
         # Load configuration
         config = ConfigLoader(config_file)
         
-        # Setup logger
-        log_file = config.get_backup_directory() / "clidup.log"
-        logger = setup_logger(log_file=log_file)
-        
         # Get database configuration
-        if db == DatabaseType.postgres:
+        if db == "postgres":
             db_config = config.get_postgres_config()
-        elif db == DatabaseType.mysql:
+        elif db == "mysql":
             db_config = config.get_mysql_config()
-        elif db == DatabaseType.sqlite:
+        elif db == "sqlite":
             db_config = config.get_sqlite_config()
-        elif db == DatabaseType.mongodb:
+        else:  # mongodb; --db is already checked by _validate_db_type
             db_config = config.get_mongodb_config()
-        else:
-            typer.echo(f"❌ Unsupported database type: {db}", err=True)
-            raise typer.Exit(code=1)
             
-        db_handler = DatabaseFactory.get_handler(db.value, db_config)
+        db_handler = DatabaseFactory.get_handler(db, db_config)
         
         # Determine database name
         if db_name is None:
-            # Try to extract from filename using regex
+            # Try to extract from the backup filename
             backup_path = Path(file)
             db_name = extract_db_name_from_filename(backup_path.name)
             
@@ -318,13 +335,18 @@ def restore(
                 )
                 raise typer.Exit(code=1)
         
+        # Setup logger once the command is known to be runnable
+        log_file = config.get_backup_directory() / "clidup.log"
+        logger = setup_logger(log_file=log_file)
+        
         # Perform restore
         backup_file = Path(file)
         perform_restore(
             db_handler=db_handler,
             db_name=db_name,
             backup_file=backup_file,
-            skip_confirmation=yes
+            skip_confirmation=yes,
+            check_connection=check_conn
         )
         
         typer.echo(f"Logs: {log_file}")
@@ -5,11 +5,52 @@ Loads configuration from YAML file and environment variables.
 """
 
 import os
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv, find_dotenv
 
+# Use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed config files: resolved path -> (stat signature, parsed YAML)
+_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _read_config_cached(path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a YAML file, reusing the result while the file is unchanged
+    
+    The file is parsed again when its mtime, size or inode changes.
+    The returned dict is shared between callers and must be treated as read-only.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed configuration (empty dict for an empty file)
+    """
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = str(Path(path).resolve())
+    
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+        
+        _CACHE[key] = (signature, config)
+        return config
+
 
 class ConfigLoader:
     """Loads and validates configuration from YAML and environment variables"""
@@ -54,9 +95,7 @@ class ConfigLoader:
     def _load_yaml(self) -> Dict[str, Any]:
         """Load and parse YAML configuration file"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config if config else {}
+            return _read_config_cached(self.config_path)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing config.yaml: {e}")
         except FileNotFoundError:
@@ -101,7 +140,8 @@ class ConfigLoader:
             'port': mysql.get('port', 3306),
             'username': mysql.get('username', 'root'),
             'database': mysql.get('database', ''),
-            'password': password or ''  # Password might be empty for local dev
+            'password': password or '',  # Password might be empty for local dev
+            'dump_options': mysql.get('dump_options')  # None means handler defaults
         }
 
     def get_sqlite_config(self) -> Dict[str, Any]:
@@ -127,7 +167,9 @@ class ConfigLoader:
             'username': mongo.get('username', ''),
             'database': mongo.get('database', ''),
             'auth_database': mongo.get('auth_database', 'admin'),
-            'password': password or ''
+            'password': password or '',
+            'parallel': mongo.get('parallel'),  # None means one per CPU
+            'insertion_workers': mongo.get('insertion_workers')
         }
 
     def get_backup_directory(self) -> Path:
@@ -5,6 +5,7 @@ Coordinates database backup operations with compression and logging.
 """
 
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -29,7 +30,7 @@ def generate_backup_filename(db_type: str, db_name: str) -> str:
     Returns:
         Backup filename
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     return f"{db_type}_{db_name}_full_{timestamp}.sql"
 
 
@@ -38,7 +39,8 @@ def perform_backup(
     db_type: str,
     db_name: str,
     backup_dir: Path,
-    compress: bool = False
+    compress: bool = False,
+    check_connection: bool = False
 ) -> Path:
     """
     Perform database backup
@@ -49,6 +51,7 @@ def perform_backup(
         db_name: Database name to backup
         backup_dir: Directory to store backup
         compress: Whether to compress the backup
+        check_connection: Test the database connection before dumping
         
     Returns:
         Path to backup file (compressed or uncompressed)
@@ -61,6 +64,10 @@ def perform_backup(
     # Validate database tools
     db_handler.validate_tools()
     
+    # The dump tool reports connection errors itself, so this is opt-in
+    if check_connection:
+        db_handler.validate_connection()
+    
     # Generate backup filename
     filename = generate_backup_filename(db_type, db_name)
     backup_file = backup_dir / filename
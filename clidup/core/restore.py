@@ -49,7 +49,8 @@ def perform_restore(
     db_handler: DatabaseHandler,
     db_name: str,
     backup_file: Path,
-    skip_confirmation: bool = False
+    skip_confirmation: bool = False,
+    check_connection: bool = False
 ) -> None:
     """
     Perform database restore
@@ -59,6 +60,7 @@ def perform_restore(
         db_name: Database name to restore to
         backup_file: Path to backup file
         skip_confirmation: Skip user confirmation (use with caution)
+        check_connection: Test the database connection before restoring
         
     Raises:
         RuntimeError: If restore fails
@@ -73,6 +75,10 @@ def perform_restore(
     # Validate database tools
     db_handler.validate_tools()
     
+    # The restore tool reports connection errors itself, so this is opt-in
+    if check_connection:
+        db_handler.validate_connection()
+    
     # Get user confirmation
     if not skip_confirmation:
         if not confirm_restore(db_name):
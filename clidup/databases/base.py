@@ -5,8 +5,24 @@ Defines the interface that all database implementations must follow.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import shutil
+
+
+@lru_cache(maxsize=32)
+def find_tool(tool: str) -> Optional[str]:
+    """
+    Locate an executable on PATH, memoized per process
+    
+    Args:
+        tool: Executable name (e.g. 'pg_dump')
+        
+    Returns:
+        Full path to the executable, or None if it is not installed
+    """
+    return shutil.which(tool)
 
 
 class DatabaseHandler(ABC):
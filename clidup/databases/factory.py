@@ -4,14 +4,11 @@ Database handler factory
 Creates and returns the appropriate database handler instance based on type.
 """
 
-from typing import Dict, Any, Type
+from typing import Dict, Any, Tuple, Type
+import importlib
 import logging
 
 from .base import DatabaseHandler
-from .postgres import PostgresHandler
-from .mysql import MySQLHandler
-from .sqlite import SQLiteHandler
-from .mongodb import MongoDBHandler
 
 
 logger = logging.getLogger("clidup")
@@ -20,13 +17,16 @@ logger = logging.getLogger("clidup")
 class DatabaseFactory:
     """Factory for creating database handlers"""
     
-    _handlers: Dict[str, Type[DatabaseHandler]] = {
-        'postgres': PostgresHandler,
-        'mysql': MySQLHandler,
-        'sqlite': SQLiteHandler,
-        'mongodb': MongoDBHandler
+    # Handler modules are imported on demand, only the selected one is loaded
+    _handlers: Dict[str, Tuple[str, str]] = {
+        'postgres': ('clidup.databases.postgres', 'PostgresHandler'),
+        'mysql': ('clidup.databases.mysql', 'MySQLHandler'),
+        'sqlite': ('clidup.databases.sqlite', 'SQLiteHandler'),
+        'mongodb': ('clidup.databases.mongodb', 'MongoDBHandler')
     }
     
+    _resolved: Dict[str, Type[DatabaseHandler]] = {}
+    
     @classmethod
     def get_handler(cls, db_type: str, config: Dict[str, Any]) -> DatabaseHandler:
         """
@@ -42,9 +42,16 @@ class DatabaseFactory:
         Raises:
             ValueError: If database type is not supported
         """
-        handler_cls = cls._handlers.get(db_type)
+        handler_cls = cls._resolved.get(db_type)
         
-        if not handler_cls:
-            raise ValueError(f"Unsupported database type: {db_type}. Supported types: {list(cls._handlers.keys())}")
+        if handler_cls is None:
+            handler_path = cls._handlers.get(db_type)
+            
+            if not handler_path:
+                raise ValueError(f"Unsupported database type: {db_type}. Supported types: {list(cls._handlers.keys())}")
+            
+            module_name, cls_name = handler_path
+            handler_cls = getattr(importlib.import_module(module_name), cls_name)
+            cls._resolved[db_type] = handler_cls
             
         return handler_cls(config)
@@ -5,14 +5,14 @@ Implements backup and restore operations using mongodump and mongorestore.
 """
 
 import subprocess
-import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, List
 import logging
-from datetime import datetime
+import time
 import os
 
-from .base import DatabaseHandler
+from .base import DatabaseHandler, find_tool
 
 
 logger = logging.getLogger("clidup")
@@ -26,15 +26,52 @@ class MongoDBHandler(DatabaseHandler):
         Initialize MongoDB handler
         
         Args:
-            config: MongoDB configuration with host, port, username, password, database
+            config: MongoDB configuration with host, port, username, password, database,
+                and optional parallel / insertion_workers
+                
+        Raises:
+            ValueError: If parallel or insertion_workers is not a positive integer
         """
         super().__init__(config)
         self.host = config.get('host', 'localhost')
         self.port = config.get('port', 27017)
+        self._port_s = str(self.port)
         self.username = config.get('username', '')
         self.password = config.get('password', '')
         self.database = config.get('database', '')
         self.auth_db = config.get('auth_database', 'admin')
+        # Collections dumped / documents inserted concurrently by the tools
+        self.parallel = self._parse_worker_count(
+            'parallel', config.get('parallel'), os.cpu_count() or 4
+        )
+        self.insertion_workers = self._parse_worker_count(
+            'insertion_workers', config.get('insertion_workers'), 4
+        )
+    
+    @staticmethod
+    def _parse_worker_count(key: str, value: Any, default: int) -> int:
+        """
+        Validate a worker count from the mongodb config
+        
+        Args:
+            key: Config key, used in the error message
+            value: Configured value, None for the default
+            default: Value used when the key is not set
+            
+        Returns:
+            Positive worker count
+            
+        Raises:
+            ValueError: If value is not a positive integer
+        """
+        if value is None:
+            return default
+        # bool is an int subclass, but 'parallel: true' is a config mistake
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(
+                f"mongodb.{key} must be a positive integer, got: {value!r}"
+            )
+        return value
         
     def validate_tools(self) -> bool:
         """
@@ -44,14 +81,14 @@ class MongoDBHandler(DatabaseHandler):
             True if tools are available
         """
         # Check for mongodump
-        if not shutil.which('mongodump'):
+        if not find_tool('mongodump'):
             raise RuntimeError(
                 "mongodump not found. Please install MongoDB Database Tools.\n"
                 "Download from: https://www.mongodb.com/try/download/database-tools"
             )
         
         # Check for mongorestore
-        if not shutil.which('mongorestore'):
+        if not find_tool('mongorestore'):
             raise RuntimeError(
                 "mongorestore not found. Please install MongoDB Database Tools.\n"
                 "Download from: https://www.mongodb.com/try/download/database-tools"
@@ -59,9 +96,6 @@ class MongoDBHandler(DatabaseHandler):
         
         logger.debug("MongoDB tools validated successfully")
         
-        # Test connection
-        self.validate_connection()
-        
         return True
     
     def validate_connection(self) -> bool:
@@ -74,7 +108,7 @@ class MongoDBHandler(DatabaseHandler):
         logger.debug(f"Testing connection to MongoDB at {self.host}:{self.port}")
         
         # We can use mongosh if available, otherwise we might skip or try a dummy dump
-        if shutil.which('mongosh'):
+        if find_tool('mongosh'):
             cmd = self._build_base_cmd('mongosh')
             cmd.extend(['--eval', 'db.runCommand({ ping: 1 })'])
             
@@ -102,34 +136,41 @@ class MongoDBHandler(DatabaseHandler):
         """
         Get default backup filename for MongoDB
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         db_part = database if database else (self.database if self.database else "all")
         return f"mongo_{db_part}_{timestamp}.archive"
     
     def _build_base_cmd(self, tool: str) -> List[str]:
         """Build base command with connection args"""
-        cmd = [
-            tool,
-            '--host', self.host,
-            '--port', str(self.port)
-        ]
+        cmd = [tool, '--host', self.host, '--port', self._port_s]
         
         if self.username:
-            cmd.extend(['--username', self.username])
-            cmd.extend(['--password', self.password])
-            cmd.extend(['--authenticationDatabase', self.auth_db])
+            cmd += [
+                '--username', self.username,
+                '--password', self.password,
+                '--authenticationDatabase', self.auth_db
+            ]
             
         return cmd
 
     def backup(self, database: str, output_file: Path) -> None:
         """
         Perform MongoDB backup using mongodump with --archive
+        
+        If pigz is installed, the archive is streamed through it so compression
+        runs on all cores instead of inside the single-threaded mongodump.
         """
         target_db = database if database else self.database
         logger.info(f"Starting MongoDB backup for database '{target_db or 'ALL'}'")
         
+        pigz = find_tool('pigz')
+        if pigz:
+            self._backup_with_pigz(pigz, target_db, output_file)
+            return
+        
         cmd = self._build_base_cmd('mongodump')
         cmd.extend(['--archive=' + str(output_file), '--gzip'])
+        cmd.extend(['--numParallelCollections', str(self.parallel)])
         
         if target_db:
             cmd.extend(['--db', target_db])
@@ -137,7 +178,8 @@ class MongoDBHandler(DatabaseHandler):
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600,
                 check=True
@@ -148,6 +190,72 @@ class MongoDBHandler(DatabaseHandler):
             error_msg = f"Backup failed: {e.stderr if e.stderr else str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
+    
+    def _backup_with_pigz(self, pigz: str, target_db: str, output_file: Path) -> None:
+        """
+        Pipe an uncompressed mongodump archive through pigz
+        
+        The result is a gzip stream, readable by mongorestore --archive --gzip
+        like the output of mongodump --gzip.
+        """
+        cmd = self._build_base_cmd('mongodump')
+        cmd.append('--archive')
+        cmd.extend(['--numParallelCollections', str(self.parallel)])
+        
+        if target_db:
+            cmd.extend(['--db', target_db])
+        
+        pigz_cmd = [pigz, '-c', '-p', str(os.cpu_count() or 1)]
+        logger.debug(f"Compressing mongodump output with {pigz}")
+        
+        # mongodump logs progress to stderr; a temp file can't fill up and block it
+        with open(output_file, 'wb') as out, tempfile.TemporaryFile() as dump_err:
+            dump = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=dump_err)
+            try:
+                compressor = subprocess.Popen(
+                    pigz_cmd,
+                    stdin=dump.stdout,
+                    stdout=out,
+                    stderr=subprocess.PIPE
+                )
+            except OSError as e:
+                # Don't leave mongodump running with nobody reading its output
+                dump.kill()
+                dump.wait()
+                error_msg = f"Backup failed: could not start pigz: {e}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg) from e
+            finally:
+                # Only pigz holds the read end now, so it sees EOF/SIGPIPE correctly
+                dump.stdout.close()
+            
+            try:
+                _, pigz_err = compressor.communicate(timeout=3600)
+                dump.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                dump.kill()
+                compressor.kill()
+                dump.wait()
+                compressor.wait()
+                error_msg = "Backup failed: mongodump | pigz timed out"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            
+            # A failing pigz makes mongodump die of SIGPIPE, so its error is the real cause
+            if compressor.returncode != 0:
+                detail = pigz_err.decode(errors='replace').strip()
+                error_msg = f"Backup failed: {detail or f'pigz exited with code {compressor.returncode}'}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            
+            if dump.returncode != 0:
+                dump_err.seek(0)
+                detail = dump_err.read().decode(errors='replace').strip()
+                error_msg = f"Backup failed: {detail or f'mongodump exited with code {dump.returncode}'}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+        
+        logger.debug("mongodump | pigz completed successfully")
             
     def restore(self, database: str, input_file: Path) -> None:
         """
@@ -158,6 +266,10 @@ class MongoDBHandler(DatabaseHandler):
         
         cmd = self._build_base_cmd('mongorestore')
         cmd.extend(['--archive=' + str(input_file), '--gzip'])
+        cmd.extend([
+            '--numParallelCollections', str(self.parallel),
+            '--numInsertionWorkersPerCollection', str(self.insertion_workers)
+        ])
         
         if target_db:
              # --nsInclude is good for partial restores, but --db works if archive has that db
@@ -179,7 +291,8 @@ class MongoDBHandler(DatabaseHandler):
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600,
                 check=True
@@ -5,18 +5,21 @@ Implements backup and restore operations using mysqldump and mysql.
 """
 
 import subprocess
-import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
-from datetime import datetime
+import time
 import os
+import shlex
 
-from .base import DatabaseHandler
+from .base import DatabaseHandler, find_tool
 
 
 logger = logging.getLogger("clidup")
 
+# Consistent InnoDB snapshot without locks, row-by-row fetch, compressed protocol
+DEFAULT_DUMP_OPTIONS = ['--single-transaction', '--quick', '--compress']
+
 
 class MySQLHandler(DatabaseHandler):
     """MySQL backup and restore implementation"""
@@ -27,13 +30,50 @@ class MySQLHandler(DatabaseHandler):
         
         Args:
             config: MySQL configuration with host, port, username, password, database
+                and optional dump_options (replaces the default mysqldump flags)
+                
+        Raises:
+            ValueError: If dump_options is not a string or a list of strings
         """
         super().__init__(config)
         self.host = config.get('host', 'localhost')
         self.port = config.get('port', 3306)
+        self._port_s = str(self.port)
         self.username = config.get('username', 'root')
         self.password = config.get('password', '')
         self.default_database = config.get('database', '')
+        self.dump_options = self._parse_dump_options(config.get('dump_options'))
+        self._db_exists_cache: Dict[str, bool] = {}
+        
+        # Environment for mysql/mysqldump, built once and shared by every call
+        self._subprocess_env: Dict[str, str] = {
+            **os.environ,
+            **({'MYSQL_PWD': self.password} if self.password else {})
+        }
+        
+    @staticmethod
+    def _parse_dump_options(dump_options: Any) -> List[str]:
+        """
+        Normalize the dump_options config value into mysqldump arguments
+        
+        Args:
+            dump_options: None for defaults, a shell-style string or a list of strings
+            
+        Returns:
+            List of mysqldump flags
+            
+        Raises:
+            ValueError: If dump_options has an unsupported type
+        """
+        if dump_options is None:
+            return list(DEFAULT_DUMP_OPTIONS)
+        if isinstance(dump_options, str):
+            return shlex.split(dump_options)
+        if isinstance(dump_options, list) and all(isinstance(opt, str) for opt in dump_options):
+            return list(dump_options)
+        raise ValueError(
+            f"mysql.dump_options must be a string or a list of strings, got: {dump_options!r}"
+        )
         
     def validate_tools(self) -> bool:
         """
@@ -46,14 +86,14 @@ class MySQLHandler(DatabaseHandler):
             RuntimeError: If required tools are not found
         """
         # Check for mysqldump
-        if not shutil.which('mysqldump'):
+        if not find_tool('mysqldump'):
             raise RuntimeError(
                 "mysqldump not found. Please install MySQL client tools.\n"
                 "Download from: https://dev.mysql.com/downloads/"
             )
         
         # Check for mysql
-        if not shutil.which('mysql'):
+        if not find_tool('mysql'):
             raise RuntimeError(
                 "mysql client not found. Please install MySQL client tools.\n"
                 "Download from: https://dev.mysql.com/downloads/"
@@ -61,9 +101,6 @@ class MySQLHandler(DatabaseHandler):
         
         logger.debug("MySQL tools validated successfully")
         
-        # Test connection to MySQL
-        self.validate_connection()
-        
         return True
     
     def validate_connection(self) -> bool:
@@ -81,7 +118,7 @@ class MySQLHandler(DatabaseHandler):
         cmd = [
             'mysql',
             '-h', self.host,
-            '-P', str(self.port),
+            '-P', self._port_s,
             '-u', self.username,
             '-e', 'SELECT 1;'
         ]
@@ -89,7 +126,7 @@ class MySQLHandler(DatabaseHandler):
         try:
             result = subprocess.run(
                 cmd,
-                env=self._get_env(),
+                env=self._subprocess_env,
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -119,21 +156,9 @@ class MySQLHandler(DatabaseHandler):
         Returns:
             Filename string
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         return f"mysql_{database}_full_{timestamp}.sql"
     
-    def _get_env(self) -> Dict[str, str]:
-        """
-        Get environment variables for MySQL commands
-        
-        Returns:
-            Dictionary with MYSQL_PWD set
-        """
-        env = os.environ.copy()
-        if self.password:
-            env['MYSQL_PWD'] = self.password
-        return env
-    
     def _database_exists(self, database: str) -> bool:
         """
         Check if a database exists in MySQL
@@ -144,29 +169,35 @@ class MySQLHandler(DatabaseHandler):
         Returns:
             True if database exists, False otherwise
         """
+        # Each check forks a mysql client, so remember the answer per handler
+        if database in self._db_exists_cache:
+            return self._db_exists_cache[database]
+        
+        # Exact match on SCHEMA_NAME (SHOW DATABASES LIKE treats '_' as a wildcard)
+        escaped = database.replace("\\", "\\\\").replace("'", "''")
         cmd = [
             'mysql',
             '-h', self.host,
-            '-P', str(self.port),
+            '-P', self._port_s,
             '-u', self.username,
-            '-e', f"SHOW DATABASES LIKE '{database}';"
+            '-N',  # Skip column names
+            '-e', f"SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = '{escaped}';"
         ]
         
         try:
             result = subprocess.run(
                 cmd,
-                env=self._get_env(),
+                env=self._subprocess_env,
                 capture_output=True,
                 text=True,
                 timeout=10,
                 check=True
             )
             
-            # If output contains header and row, database exists
-            # Example output:
-            # Database (test_db)
-            # test_db
-            return len(result.stdout.strip().split('\n')) > 1
+            # Any returned row means the database exists
+            exists = bool(result.stdout.strip())
+            self._db_exists_cache[database] = exists
+            return exists
             
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
             logger.warning(f"Could not check if database '{database}' exists")
@@ -189,9 +220,10 @@ class MySQLHandler(DatabaseHandler):
         cmd = [
             'mysqldump',
             '-h', self.host,
-            '-P', str(self.port),
+            '-P', self._port_s,
             '-u', self.username,
             '--result-file', str(output_file),
+            *self.dump_options,
             database
         ]
         
@@ -200,8 +232,9 @@ class MySQLHandler(DatabaseHandler):
             # Note: mysqldump usually doesn't output much to stdout/stderr unless there's an error
             result = subprocess.run(
                 cmd,
-                env=self._get_env(),
-                capture_output=True,
+                env=self._subprocess_env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600,
                 check=True
@@ -238,19 +271,21 @@ class MySQLHandler(DatabaseHandler):
         cmd = [
             'mysql',
             '-h', self.host,
-            '-P', str(self.port),
+            '-P', self._port_s,
             '-u', self.username,
             database
         ]
         
         try:
-            with open(input_file, 'r') as f:
+            # Binary mode: the dump is handed to mysql as raw bytes
+            with open(input_file, 'rb') as f:
                 result = subprocess.run(
                     cmd,
-                    env=self._get_env(),
+                    env=self._subprocess_env,
                     stdin=f,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    errors='replace',
                     timeout=3600,
                     check=True
                 )
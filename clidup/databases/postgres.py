@@ -5,12 +5,12 @@ Implements backup and restore operations using pg_dump and psql.
 """
 
 import subprocess
-import shutil
 from pathlib import Path
 from typing import Dict, Any
 import logging
+import time
 
-from .base import DatabaseHandler
+from .base import DatabaseHandler, find_tool
 
 
 logger = logging.getLogger("clidup")
@@ -44,14 +44,14 @@ class PostgresHandler(DatabaseHandler):
             RuntimeError: If required tools are not found
         """
         # Check for pg_dump
-        if not shutil.which('pg_dump'):
+        if not find_tool('pg_dump'):
             raise RuntimeError(
                 "pg_dump not found. Please install PostgreSQL client tools.\n"
                 "Download from: https://www.postgresql.org/download/"
             )
         
         # Check for psql
-        if not shutil.which('psql'):
+        if not find_tool('psql'):
             raise RuntimeError(
                 "psql not found. Please install PostgreSQL client tools.\n"
                 "Download from: https://www.postgresql.org/download/"
@@ -59,11 +59,6 @@ class PostgresHandler(DatabaseHandler):
         
         logger.debug("PostgreSQL tools validated successfully")
         
-        # Test connection to PostgreSQL
-        self.validate_connection()
-        
-        return True
-    
         return True
     
     def validate_connection(self) -> bool:
@@ -120,8 +115,7 @@ class PostgresHandler(DatabaseHandler):
         Returns:
             Filename string
         """
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         return f"postgres_{database}_full_{timestamp}.sql"
     
     def _get_env(self) -> Dict[str, str]:
@@ -202,7 +196,8 @@ class PostgresHandler(DatabaseHandler):
             result = subprocess.run(
                 cmd,
                 env=self._get_env(),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600,  # 1 hour timeout for large backups
                 check=True
@@ -258,7 +253,8 @@ class PostgresHandler(DatabaseHandler):
             result = subprocess.run(
                 cmd,
                 env=self._get_env(),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600,  # 1 hour timeout for large restores
                 check=True
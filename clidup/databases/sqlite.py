@@ -1,14 +1,15 @@
 """
 SQLite database handler
 
-Implements backup and restore operations using file copy.
+Implements backup using SQLite's online backup API and restore using file copy.
 """
 
 import shutil
+import sqlite3
 from pathlib import Path
 from typing import Dict, Any
 import logging
-from datetime import datetime
+import time
 import os
 
 from .base import DatabaseHandler
@@ -74,7 +75,7 @@ class SQLiteHandler(DatabaseHandler):
         Returns:
             Filename string
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         name = self.db_path.stem
         # If database arg is provided and different from stem, use it, otherwise use stem
         if database and database != "sqlite":
@@ -84,7 +85,7 @@ class SQLiteHandler(DatabaseHandler):
     
     def backup(self, database: str, output_file: Path) -> None:
         """
-        Perform SQLite backup using file copy
+        Perform SQLite backup using the online backup API
         
         Args:
             database: Name of database (ignored for SQLite single file)
@@ -99,9 +100,17 @@ class SQLiteHandler(DatabaseHandler):
              raise RuntimeError(f"Database file {self.db_path} does not exist")
              
         try:
-            # Simple file copy
-            shutil.copy2(self.db_path, output_file)
-            logger.debug(f"File copied successfully to {output_file}")
+            # Online backup is consistent even if another process is writing
+            source = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                target = sqlite3.connect(str(output_file))
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+            logger.debug(f"Database backed up successfully to {output_file}")
             
         except Exception as e:
             error_msg = f"Unexpected error during backup: {str(e)}"
@@ -125,7 +134,7 @@ class SQLiteHandler(DatabaseHandler):
             # Backup current file just in case? Maybe too complex for now.
             # Just overwrite as requested.
             
-            shutil.copy2(input_file, self.db_path)
+            shutil.copyfile(input_file, self.db_path)
             logger.debug(f"File restored successfully from {input_file}")
             
         except FileNotFoundError:
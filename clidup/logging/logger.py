@@ -58,11 +58,13 @@ def setup_logger(
     log_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Rotating file handler: max 10MB, keep 5 backup files
+    # delay=True opens the file on the first record instead of up front
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=5,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
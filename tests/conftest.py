@@ -3,45 +3,120 @@ from pathlib import Path
 import os
 import yaml
 
-@pytest.fixture
-def mock_config_file(tmp_path):
-    """Create a temporary config.yaml file"""
+from clidup.config.loader import ConfigLoader
+
+# Import the CLI stack (typer, click, rich) once at conftest load so every
+# xdist worker pays for it up front instead of inside the first CLI test
+from typer.testing import CliRunner
+from clidup.cli.main import app
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+@pytest.fixture(scope="session", autouse=True)
+def no_dotenv():
+    """Keep ConfigLoader from searching for and loading a real .env file"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('clidup.config.loader.load_dotenv', lambda *args, **kwargs: False)
+        mp.setattr('clidup.config.loader.find_dotenv', lambda *args, **kwargs: '')
+        yield
+
+# Config sections that don't depend on the temp directory
+_STATIC_CONFIG = {
+    'postgres': {
+        'host': 'localhost',
+        'port': 5432,
+        'username': 'postgres',
+        'database': 'test_db'
+    },
+    'mysql': {
+        'host': 'localhost',
+        'port': 3306,
+        'username': 'root',
+        'database': 'test_db'
+    },
+    'mongodb': {
+        'host': 'localhost',
+        'port': 27017,
+        'username': 'admin',
+        'auth_database': 'admin'
+    }
+}
+
+@pytest.fixture(scope="session")
+def mock_config_file(tmp_path_factory):
+    """Create a temporary config.yaml file, shared by the whole session"""
+    tmp_path = tmp_path_factory.mktemp("cfg")
+    # Created once here, so get_backup_directory()'s mkdir is always a no-op
+    backup_dir = tmp_path / 'backups'
+    backup_dir.mkdir()
     config_content = {
-        'postgres': {
-            'host': 'localhost',
-            'port': 5432,
-            'username': 'postgres',
-            'database': 'test_db'
-        },
-        'mysql': {
-            'host': 'localhost',
-            'port': 3306,
-            'username': 'root',
-            'database': 'test_db'
-        },
-        'sqlite': {
-            'db_path': str(tmp_path / 'test.db')
-        },
-        'mongodb': {
-            'host': 'localhost',
-            'port': 27017,
-            'username': 'admin',
-            'auth_database': 'admin'
-        },
-        'backup': {
-            'directory': str(tmp_path / 'backups')
-        }
+        **_STATIC_CONFIG,
+        'sqlite': {'db_path': str(tmp_path / 'test.db')},
+        'backup': {'directory': str(backup_dir)}
     }
     
     config_file = tmp_path / 'config.yaml'
     with open(config_file, 'w') as f:
-        yaml.dump(config_content, f)
+        yaml.dump(config_content, f, Dumper=_Dumper, default_flow_style=False)
         
     return config_file
 
-@pytest.fixture
-def mock_env_vars(monkeypatch):
-    """Set environment variables for testing"""
-    monkeypatch.setenv('POSTGRES_PASSWORD', 'pg_pass')
-    monkeypatch.setenv('MYSQL_PASSWORD', 'mysql_pass')
-    monkeypatch.setenv('MONGODB_PASSWORD', 'mongo_pass')
+_TEST_ENV = {
+    'POSTGRES_PASSWORD': 'pg_pass',
+    'MYSQL_PASSWORD': 'mysql_pass',
+    'MONGODB_PASSWORD': 'mongo_pass'
+}
+
+@pytest.fixture(scope="session")
+def mock_env_vars():
+    """Set environment variables for the whole session, restored afterwards"""
+    previous = {key: os.environ.get(key) for key in _TEST_ENV}
+    os.environ.update(_TEST_ENV)
+    yield
+    for key, value in previous.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+@pytest.fixture(scope="session")
+def config_loader(mock_config_file, mock_env_vars):
+    """ConfigLoader for the session config file, for tests that only read it"""
+    return ConfigLoader(str(mock_config_file))
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Forget memoized PATH lookups so tests can patch shutil.which"""
+    from clidup.databases.base import find_tool
+    find_tool.cache_clear()
+    yield
+    find_tool.cache_clear()
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """CliRunner shared by all CLI tests"""
+    return CliRunner()
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """The clidup Typer application"""
+    return app
+
+@pytest.fixture(scope="session")
+def invoke_fast(cli_app):
+    """
+    Run the CLI in-process without CliRunner's output capture
+    
+    For tests that only need the exit code; output goes to pytest's capsys.
+    """
+    def invoke(args):
+        try:
+            result = cli_app(args, standalone_mode=False)
+        except SystemExit as e:
+            return e.code
+        # Click returns the exit code for typer.Exit, the command's return value otherwise
+        return result if isinstance(result, int) else 0
+    return invoke
@@ -1,76 +1,113 @@
 import pytest
-from typer.testing import CliRunner
-from unittest.mock import patch, MagicMock
-from clidup.cli.main import app
+from contextlib import ExitStack
+from unittest.mock import patch, Mock
 
-runner = CliRunner()
+# Keep these tests on one xdist worker so module/session fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="cli")
 
-def test_version():
-    result = runner.invoke(app, ["--version"])
+def test_version(cli_runner, cli_app):
+    result = cli_runner.invoke(cli_app, ["--version"])
     assert result.exit_code == 0
     assert "clidup version" in result.stdout
 
-def test_help():
-    result = runner.invoke(app, ["--help"])
+def test_help(cli_runner, cli_app):
+    result = cli_runner.invoke(cli_app, ["--help"])
     assert result.exit_code == 0
     assert "Professional CLI tool" in result.stdout
 
-def test_backup_command_missing_args():
-    result = runner.invoke(app, ["backup"])
+def test_backup_command_missing_args(cli_runner, cli_app):
+    result = cli_runner.invoke(cli_app, ["backup"])
     assert result.exit_code != 0
-    assert "Missing option" in result.stdout
+    # Usage errors go to stderr; output holds both streams
+    assert "Missing option" in result.output
 
-@pytest.fixture
-def mock_config_loader(tmp_path):
-    with patch('clidup.cli.main.ConfigLoader') as MockLoader:
-        instance = MockLoader.return_value
-        instance.get_backup_directory.return_value = tmp_path
-        # Mock configs
-        instance.get_postgres_config.return_value = {
-            'host': 'localhost', 'port': 5432, 
-            'username': 'user', 'password': 'pw', 
-            'database': 'db'
-        }
-        yield MockLoader
+# Names the backup/restore commands import when they run, patched at their source
+_CLI_PATCH_TARGETS = {
+    'ConfigLoader': 'clidup.config.loader.ConfigLoader',
+    'setup_logger': 'clidup.logging.logger.setup_logger',
+    'DatabaseFactory': 'clidup.databases.factory.DatabaseFactory',
+    'perform_backup': 'clidup.core.backup.perform_backup',
+    'perform_restore': 'clidup.core.restore.perform_restore',
+}
 
-@pytest.fixture
-def mock_dependencies():
-    with patch('clidup.cli.main.setup_logger'), \
-         patch('clidup.cli.main.DatabaseFactory') as mock_factory:
-         # factory.get_handler returns a mock handler
-         mock_factory.get_handler.return_value = MagicMock()
-         yield
+@pytest.fixture(scope="module")
+def cli_patches(tmp_path_factory):
+    """Patch every CLI dependency once per module; yields the mocks by name"""
+    from clidup.config.loader import ConfigLoader
+    from clidup.databases.base import DatabaseHandler
+    
+    loader = Mock(spec=ConfigLoader)
+    loader.get_backup_directory.return_value = tmp_path_factory.mktemp("cli")
+    # Mock configs
+    loader.get_postgres_config.return_value = {
+        'host': 'localhost', 'port': 5432, 
+        'username': 'user', 'password': 'pw', 
+        'database': 'db'
+    }
+    factory = Mock()
+    # factory.get_handler returns a mock handler
+    factory.get_handler.return_value = Mock(spec=DatabaseHandler)
+    
+    mocks = {
+        'ConfigLoader': Mock(return_value=loader),
+        'setup_logger': Mock(),
+        'DatabaseFactory': factory,
+        'perform_backup': Mock(return_value="backup.sql"),
+        'perform_restore': Mock(),
+    }
+    with ExitStack() as stack:
+        for name, target in _CLI_PATCH_TARGETS.items():
+            stack.enter_context(patch(target, mocks[name]))
+        yield mocks
 
-def test_backup_flow(mock_config_loader, mock_dependencies):
-    with patch('clidup.cli.main.perform_backup') as mock_perform:
-        mock_perform.return_value = "backup.sql"
-        
-        result = runner.invoke(app, [
-            "backup", 
-            "--db", "postgres", 
-            "--db-name", "test_db",
-            "--config", "config.yaml"
-        ])
-        
-        if result.exit_code != 0:
-            print(f"Stdout: {result.stdout}")
-        
-        assert result.exit_code == 0
-        assert "Backup completed successfully" in result.stdout
-        mock_perform.assert_called_once()
+@pytest.fixture(autouse=True)
+def reset_cli_mocks(request):
+    """Clear recorded calls on the module-scoped mocks after each test (return values are kept)"""
+    yield
+    if 'cli_patches' in request.fixturenames:
+        for mock in request.getfixturevalue('cli_patches').values():
+            mock.reset_mock()
 
-def test_restore_flow(mock_config_loader, mock_dependencies):
-    with patch('clidup.cli.main.perform_restore') as mock_perform:
-        result = runner.invoke(app, [
-            "restore",
-            "--db", "postgres",
-            "--file", "backup.sql",
-            "--db-name", "test_db",
-            "--yes"  # skip confirmation
-        ])
-        
-        if result.exit_code != 0:
-            print(f"Stdout: {result.stdout}")
-        
-        assert result.exit_code == 0
-        mock_perform.assert_called_once()
+def test_backup_flow(invoke_fast, capsys, cli_patches):
+    exit_code = invoke_fast([
+        "backup", 
+        "--db", "postgres", 
+        "--db-name", "test_db",
+        "--config", "config.yaml"
+    ])
+    
+    stdout = capsys.readouterr().out
+    if exit_code != 0:
+        print(f"Stdout: {stdout}")
+    
+    assert exit_code == 0
+    assert "Backup completed successfully" in stdout
+    cli_patches['perform_backup'].assert_called_once()
+
+def test_restore_flow(invoke_fast, cli_patches):
+    exit_code = invoke_fast([
+        "restore",
+        "--db", "postgres",
+        "--file", "backup.sql",
+        "--db-name", "test_db",
+        "--yes"  # skip confirmation
+    ])
+    
+    assert exit_code == 0
+    cli_patches['perform_restore'].assert_called_once()
+
+@pytest.mark.parametrize("filename,expected", [
+    ("postgres_mydb_full_2026-01-07_23-45-12.sql", "mydb"),
+    ("postgres_my_production_db_full_2026-01-07_23-45-12.sql.tar", "my_production_db"),
+    ("mysql_shop_full_2026-01-07_23-45.sql.tar.gz", "shop"),
+    ("postgres_mydb_full_2026-01-07_23-45-12", "mydb"),
+    ("random_backup.sql", None),
+])
+def test_extract_db_name_from_filename(filename, expected):
+    from clidup.cli.main import extract_db_name_from_filename
+    assert extract_db_name_from_filename(filename) == expected
+
+def test_backup_invalid_db_type(cli_runner, cli_app):
+    result = cli_runner.invoke(cli_app, ["backup", "--db", "oracle", "--db-name", "test_db"])
+    assert result.exit_code == 2
+    assert "oracle" in result.output
@@ -1,11 +1,11 @@
 import pytest
+import shutil
 from pathlib import Path
-from unittest.mock import patch
 from clidup.config.loader import ConfigLoader
 
-def test_load_config(mock_config_file, mock_env_vars):
+def test_load_config(config_loader):
     """Test loading configuration from file and env vars"""
-    loader = ConfigLoader(str(mock_config_file))
+    loader = config_loader
     
     # Check Postgres config
     pg_config = loader.get_postgres_config()
@@ -33,10 +33,23 @@ def test_config_not_found():
 
 def test_missing_env_password(mock_config_file, monkeypatch):
     """Test error when password env var is missing"""
-    # Prevent loading correct .env from disk
-    with patch('clidup.config.loader.load_dotenv'):
-        monkeypatch.delenv('POSTGRES_PASSWORD', raising=False)
-        loader = ConfigLoader(str(mock_config_file))
-        
-        with pytest.raises(ValueError, match="POSTGRES_PASSWORD environment variable not set"):
-            loader.get_postgres_config()
+    # .env loading is disabled by the no_dotenv fixture
+    monkeypatch.delenv('POSTGRES_PASSWORD', raising=False)
+    loader = ConfigLoader(str(mock_config_file))
+    
+    with pytest.raises(ValueError, match="POSTGRES_PASSWORD environment variable not set"):
+        loader.get_postgres_config()
+
+def test_config_parse_cached_until_file_changes(mock_config_file, mock_env_vars, tmp_path):
+    """Test the parsed YAML is reused until the file is modified"""
+    # Work on a copy, the session config file is shared
+    config_file = tmp_path / 'config.yaml'
+    shutil.copyfile(mock_config_file, config_file)
+    
+    first = ConfigLoader(str(config_file))
+    second = ConfigLoader(str(config_file))
+    assert first.config is second.config
+    
+    config_file.write_text("postgres:\n  host: db.example.com\n")
+    third = ConfigLoader(str(config_file))
+    assert third.get_postgres_config()['host'] == 'db.example.com'
@@ -1,30 +1,25 @@
+import importlib
 import pytest
 from clidup.databases.factory import DatabaseFactory
-from clidup.databases.postgres import PostgresHandler
-from clidup.databases.mysql import MySQLHandler
-from clidup.databases.sqlite import SQLiteHandler
-from clidup.databases.mongodb import MongoDBHandler
 
-def test_factory_postgres():
-    config = {'host': 'localhost', 'port': 5432, 'username': 'user', 'password': 'pw', 'database': 'db'}
-    handler = DatabaseFactory.get_handler('postgres', config)
-    assert isinstance(handler, PostgresHandler)
-
-def test_factory_mysql():
-    config = {'host': 'localhost'}
-    handler = DatabaseFactory.get_handler('mysql', config)
-    assert isinstance(handler, MySQLHandler)
-
-def test_factory_sqlite():
-    config = {'db_path': 'test.db'}
-    handler = DatabaseFactory.get_handler('sqlite', config)
-    assert isinstance(handler, SQLiteHandler)
-
-def test_factory_mongodb():
-    config = {'host': 'localhost'}
-    handler = DatabaseFactory.get_handler('mongodb', config)
-    assert isinstance(handler, MongoDBHandler)
+# Handler classes are named, not imported, so collection doesn't load every handler
+@pytest.mark.parametrize("db_type,config,handler_path", [
+    ('postgres', {'host': 'localhost', 'port': 5432, 'username': 'user', 'password': 'pw', 'database': 'db'}, ('clidup.databases.postgres', 'PostgresHandler')),
+    ('mysql', {'host': 'localhost'}, ('clidup.databases.mysql', 'MySQLHandler')),
+    ('sqlite', {'db_path': 'test.db'}, ('clidup.databases.sqlite', 'SQLiteHandler')),
+    ('mongodb', {'host': 'localhost'}, ('clidup.databases.mongodb', 'MongoDBHandler')),
+])
+def test_factory_dispatch(db_type, config, handler_path):
+    module_name, cls_name = handler_path
+    handler_cls = getattr(importlib.import_module(module_name), cls_name)
+    
+    handler = DatabaseFactory.get_handler(db_type, config)
+    assert isinstance(handler, handler_cls)
 
 def test_factory_invalid_type():
     with pytest.raises(ValueError, match="Unsupported database type"):
         DatabaseFactory.get_handler('invalid', {})
+
+def test_cli_accepts_every_factory_type():
+    from clidup.cli.main import SUPPORTED_DATABASES
+    assert set(SUPPORTED_DATABASES) == set(DatabaseFactory._handlers)
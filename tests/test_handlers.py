@@ -3,10 +3,20 @@ from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 import subprocess
 
-from clidup.databases.postgres import PostgresHandler
-from clidup.databases.mysql import MySQLHandler
-from clidup.databases.sqlite import SQLiteHandler
-from clidup.databases.mongodb import MongoDBHandler
+# Keep these tests on one xdist worker so module/session fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="handlers")
+
+@pytest.fixture(autouse=True)
+def run_mock(monkeypatch):
+    """
+    Replace subprocess.run for every test in this module so no client tool ever runs
+    
+    The fake output lists test_db as an existing database. Tests that
+    assert on the call take run_mock as an argument.
+    """
+    mock = MagicMock(return_value=MagicMock(returncode=0, stdout='test_db\n', stderr=''))
+    monkeypatch.setattr(subprocess, 'run', mock)
+    return mock
 
 # --- PostgreSQL Tests ---
 
@@ -19,39 +29,15 @@ def postgres_handler():
         'password': 'password',
         'database': 'test_db'
     }
+    from clidup.databases.postgres import PostgresHandler
     return PostgresHandler(config)
 
 def test_postgres_validate_tools(postgres_handler):
     with patch('shutil.which') as mock_which:
         mock_which.return_value = '/usr/bin/pg_dump'
-        with patch.object(postgres_handler, 'validate_connection', return_value=True):
+        with patch.object(postgres_handler, 'validate_connection', return_value=True) as mock_conn:
             assert postgres_handler.validate_tools() is True
-
-def test_postgres_backup(postgres_handler):
-    with patch('subprocess.run') as mock_run:
-        mock_run.return_value.returncode = 0
-        output_file = Path('backup.sql')
-        
-        postgres_handler.backup('test_db', output_file)
-        
-        # Verify pg_dump call
-        args = mock_run.call_args[0][0]
-        assert args[0] == 'pg_dump'
-        assert '-h' in args
-        assert 'test_db' in args
-
-def test_postgres_restore(postgres_handler):
-    with patch('subprocess.run') as mock_run:
-        with patch.object(postgres_handler, '_database_exists', return_value=True):
-            mock_run.return_value.returncode = 0
-            input_file = Path('backup.sql')
-            
-            postgres_handler.restore('test_db', input_file)
-            
-            # Verify psql call
-            args = mock_run.call_args[0][0]
-            assert args[0] == 'psql'
-            assert '-f' in args
+            mock_conn.assert_not_called()
 
 # --- MySQL Tests ---
 
@@ -64,34 +50,87 @@ def mysql_handler():
         'password': 'password',
         'database': 'test_db'
     }
+    from clidup.databases.mysql import MySQLHandler
     return MySQLHandler(config)
 
-def test_mysql_backup(mysql_handler):
-    with patch('subprocess.run') as mock_run:
-         mysql_handler.backup('test_db', Path('backup.sql'))
-         args = mock_run.call_args[0][0]
-         assert args[0] == 'mysqldump'
-         assert '--result-file' in args
+def test_mysql_backup_custom_dump_options(run_mock):
+    from clidup.databases.mysql import MySQLHandler
+    handler = MySQLHandler({'dump_options': ['--lock-tables']})
+    handler.backup('test_db', Path('backup.sql'))
+    args = run_mock.call_args[0][0]
+    assert '--lock-tables' in args
+    assert '--single-transaction' not in args
+    assert args[-1] == 'test_db'
+
+def test_mysql_dump_options_string_is_split():
+    from clidup.databases.mysql import MySQLHandler
+    handler = MySQLHandler({'dump_options': '--lock-tables --quick'})
+    assert handler.dump_options == ['--lock-tables', '--quick']
+
+@pytest.mark.parametrize("dump_options", [42, ['--quick', 1], {'quick': True}])
+def test_mysql_dump_options_invalid(dump_options):
+    from clidup.databases.mysql import MySQLHandler
+    with pytest.raises(ValueError, match="dump_options"):
+        MySQLHandler({'dump_options': dump_options})
+
+def test_mysql_database_exists_cached(mysql_handler, run_mock):
+    assert mysql_handler._database_exists('test_db') is True
+    assert mysql_handler._database_exists('test_db') is True
+    run_mock.assert_called_once()
+
+def test_mysql_database_exists_escapes_name(mysql_handler, run_mock):
+    mysql_handler._database_exists("a\\b'c")
+    query = run_mock.call_args[0][0][-1]
+    assert "SCHEMA_NAME = 'a\\\\b''c'" in query
 
 # --- SQLite Tests ---
 
-@pytest.fixture
-def sqlite_handler(tmp_path):
-    db_path = tmp_path / 'test.db'
+@pytest.fixture(scope="session")
+def sqlite_handler(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("sqlite") / 'test.db'
     db_path.touch()
     config = {'db_path': str(db_path)}
+    from clidup.databases.sqlite import SQLiteHandler
     return SQLiteHandler(config)
 
 def test_sqlite_backup(sqlite_handler, tmp_path):
     output = tmp_path / 'backup.db'
-    sqlite_handler.backup('sqlite', output)
-    assert output.exists()
+    with patch('sqlite3.connect') as mock_connect:
+        source, target = MagicMock(), MagicMock()
+        mock_connect.side_effect = [source, target]
+        sqlite_handler.backup('sqlite', output)
+    
+    # Source opened read-only, copied with the online backup API
+    source_uri = mock_connect.call_args_list[0][0][0]
+    assert source_uri.endswith('test.db?mode=ro')
+    assert mock_connect.call_args_list[1][0][0] == str(output)
+    source.backup.assert_called_once_with(target)
+    source.close.assert_called_once()
+    target.close.assert_called_once()
+
+def test_sqlite_backup_roundtrip(tmp_path):
+    import sqlite3
+    from clidup.databases.sqlite import SQLiteHandler
+    db_path = tmp_path / 'source.db'
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.execute("INSERT INTO items VALUES ('widget')")
+    conn.close()
+    
+    output = tmp_path / 'backup.db'
+    SQLiteHandler({'db_path': str(db_path)}).backup('sqlite', output)
+    
+    copy = sqlite3.connect(str(output))
+    try:
+        assert copy.execute("SELECT name FROM items").fetchall() == [('widget',)]
+    finally:
+        copy.close()
 
 def test_sqlite_restore(sqlite_handler, tmp_path):
     backup = tmp_path / 'backup.db'
     backup.touch()
     
-    with patch('shutil.copy2') as mock_copy:
+    with patch('shutil.copyfile') as mock_copy:
         sqlite_handler.restore('sqlite', backup)
         mock_copy.assert_called_with(backup, sqlite_handler.db_path)
 
@@ -106,11 +145,96 @@ def mongo_handler():
         'password': 'password',
         'database': 'test_db'
     }
+    from clidup.databases.mongodb import MongoDBHandler
     return MongoDBHandler(config)
 
-def test_mongo_backup(mongo_handler):
-    with patch('subprocess.run') as mock_run:
-        mongo_handler.backup('test_db', Path('backup.archive'))
-        args = mock_run.call_args[0][0]
-        assert args[0] == 'mongodump'
-        assert '--archive=backup.archive' in args
+def test_mongo_restore(mongo_handler, run_mock):
+    mongo_handler.restore('test_db', Path('backup.archive'))
+    args = run_mock.call_args[0][0]
+    assert args[0] == 'mongorestore'
+    assert args[args.index('--numInsertionWorkersPerCollection') + 1] == '4'
+
+@pytest.mark.parametrize("key,value", [
+    ('parallel', 'auto'),
+    ('parallel', 0),
+    ('insertion_workers', -2),
+    ('insertion_workers', True),
+])
+def test_mongo_worker_count_invalid(key, value):
+    from clidup.databases.mongodb import MongoDBHandler
+    with pytest.raises(ValueError, match=f"mongodb.{key}"):
+        MongoDBHandler({key: value})
+
+def test_mongo_backup_with_pigz(mongo_handler, tmp_path):
+    with patch('shutil.which', return_value='/usr/bin/pigz'), \
+         patch('subprocess.Popen') as mock_popen:
+        mock_popen.return_value.returncode = 0
+        mock_popen.return_value.communicate.return_value = (None, b'')
+        mongo_handler.backup('test_db', tmp_path / 'backup.archive')
+        
+        dump_args = mock_popen.call_args_list[0][0][0]
+        pigz_args = mock_popen.call_args_list[1][0][0]
+        assert dump_args[0] == 'mongodump'
+        assert '--archive' in dump_args
+        assert '--gzip' not in dump_args
+        assert pigz_args[0] == '/usr/bin/pigz'
+
+def _pigz_pipeline(dump_rc=0, pigz_rc=0, pigz_err=b''):
+    """Return mocks for the mongodump and pigz processes of the pigz pipeline"""
+    dump = MagicMock(returncode=dump_rc)
+    compressor = MagicMock(returncode=pigz_rc)
+    compressor.communicate.return_value = (None, pigz_err)
+    return dump, compressor
+
+def test_mongo_backup_pigz_failure_reported_first(mongo_handler, tmp_path):
+    # pigz failing kills mongodump with SIGPIPE; pigz's error is the one to show
+    dump, compressor = _pigz_pipeline(dump_rc=141, pigz_rc=1, pigz_err=b'No space left on device')
+    with patch('shutil.which', return_value='/usr/bin/pigz'), \
+         patch('subprocess.Popen', side_effect=[dump, compressor]):
+        with pytest.raises(RuntimeError, match="No space left on device"):
+            mongo_handler.backup('test_db', tmp_path / 'backup.archive')
+
+def test_mongo_backup_pigz_mongodump_failure(mongo_handler, tmp_path):
+    dump, compressor = _pigz_pipeline(dump_rc=1)
+    with patch('shutil.which', return_value='/usr/bin/pigz'), \
+         patch('subprocess.Popen', side_effect=[dump, compressor]):
+        with pytest.raises(RuntimeError, match="mongodump exited with code 1"):
+            mongo_handler.backup('test_db', tmp_path / 'backup.archive')
+
+def test_mongo_backup_pigz_timeout_kills_both(mongo_handler, tmp_path):
+    dump, compressor = _pigz_pipeline()
+    compressor.communicate.side_effect = subprocess.TimeoutExpired('pigz', 3600)
+    with patch('shutil.which', return_value='/usr/bin/pigz'), \
+         patch('subprocess.Popen', side_effect=[dump, compressor]):
+        with pytest.raises(RuntimeError, match="timed out"):
+            mongo_handler.backup('test_db', tmp_path / 'backup.archive')
+    dump.kill.assert_called_once()
+    compressor.kill.assert_called_once()
+
+def test_mongo_backup_pigz_start_failure_kills_mongodump(mongo_handler, tmp_path):
+    dump, _ = _pigz_pipeline()
+    with patch('shutil.which', return_value='/usr/bin/pigz'), \
+         patch('subprocess.Popen', side_effect=[dump, OSError("pigz: exec failed")]):
+        with pytest.raises(RuntimeError, match="exec failed"):
+            mongo_handler.backup('test_db', tmp_path / 'backup.archive')
+    dump.kill.assert_called_once()
+    dump.wait.assert_called_once()
+
+# --- Subprocess command tests (all handlers) ---
+
+@pytest.mark.parametrize("handler_fixture,operation,file_name,tool,expected_args", [
+    ('postgres_handler', 'backup', 'backup.sql', 'pg_dump', ['-h', 'test_db']),
+    ('postgres_handler', 'restore', 'backup.sql', 'psql', ['-f']),
+    ('mysql_handler', 'backup', 'backup.sql', 'mysqldump', ['--result-file', '--single-transaction']),
+    ('mongo_handler', 'backup', 'backup.archive', 'mongodump', ['--archive=backup.archive', '--numParallelCollections']),
+])
+def test_handler_subprocess_command(request, run_mock, handler_fixture, operation, file_name, tool, expected_args):
+    handler = request.getfixturevalue(handler_fixture)
+    # No pigz, so mongodump compresses by itself
+    with patch('shutil.which', return_value=None):
+        getattr(handler, operation)('test_db', Path(file_name))
+    
+    args = run_mock.call_args[0][0]
+    assert args[0] == tool
+    for arg in expected_args:
+        assert arg in args